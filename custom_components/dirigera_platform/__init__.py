@@ -19,9 +19,13 @@ from homeassistant.const import CONF_IP_ADDRESS, CONF_TOKEN, Platform
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CONF_HIDE_DEVICE_SET_BULBS, PLATFORM, DISCOVERY_COORDINATOR
+from .const import DOMAIN, CONF_HIDE_DEVICE_SET_BULBS, PLATFORM
 from .hub_event_listener import hub_event_listener
-from .device_discovery import DeviceDiscoveryCoordinator, set_discovery_coordinator
+from .device_discovery import (
+    DeviceDiscoveryCoordinator,
+    pop_discovery_coordinator,
+    set_discovery_coordinator,
+)
 
 PLATFORMS_TO_SETUP = [  Platform.SWITCH, 
                         Platform.BINARY_SENSOR, 
@@ -202,8 +206,7 @@ async def async_setup_entry(
     # Initialize the discovery coordinator BEFORE platform setup
     # so platforms can register their callbacks during async_setup_entry
     discovery = DeviceDiscoveryCoordinator(hass, hub)
-    hass.data[DOMAIN][DISCOVERY_COORDINATOR] = discovery
-    set_discovery_coordinator(discovery)
+    set_discovery_coordinator(hass, entry.entry_id, discovery)
     logger.debug("Device discovery coordinator initialized")
 
     # Setup the entities - each platform will register its callback with discovery coordinator
@@ -268,6 +271,7 @@ async def async_unload_entry(
         ]
     )
     
+    pop_discovery_coordinator(hass, entry.entry_id)
     hass.data[DOMAIN][entry.entry_id]["unsub_options_update_listener"]()
     hass.data[DOMAIN].pop(entry.entry_id)
     logger.debug("Successfully popped entry")
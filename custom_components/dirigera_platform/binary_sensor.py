@@ -3,7 +3,8 @@ import logging
 from homeassistant import config_entries, core
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 
-from .const import DOMAIN, PLATFORM, DISCOVERY_COORDINATOR
+from .const import DOMAIN, PLATFORM
+from .device_discovery import get_discovery_coordinator
 from .base_classes import  ikea_starkvind_air_purifier_binary_sensor, ikea_motion_sensor, ikea_open_close_sensor, ikea_water_sensor
 from .ikea_gateway import ikea_gateway
 
@@ -32,15 +33,13 @@ async def async_setup_entry(
                     for device in platform.air_purifiers])
 
     # Register callback and known devices with discovery coordinator
-    discovery = hass.data[DOMAIN].get(DISCOVERY_COORDINATOR)
+    discovery = get_discovery_coordinator(hass, config_entry.entry_id)
     if discovery:
         discovery.register_platform_callback("binary_sensor", async_add_entities)
-        for sensor in platform.motion_sensors:
-            discovery.register_known_device(sensor._json_data.id)
-        for sensor in platform.open_close_sensors:
-            discovery.register_known_device(sensor._json_data.id)
-        for sensor in platform.water_sensors:
-            discovery.register_known_device(sensor._json_data.id)
+        discovery.bulk_register_known_devices(
+            sensor._json_data.id
+            for sensor in platform.motion_sensors + platform.open_close_sensors + platform.water_sensors
+        )
         total = len(platform.motion_sensors) + len(platform.open_close_sensors) + len(platform.water_sensors)
         logger.debug(f"Registered {total} binary sensors with discovery coordinator")
 
@@ -2,7 +2,8 @@ import logging
 
 from homeassistant import config_entries, core
 
-from .const import DOMAIN, PLATFORM, DISCOVERY_COORDINATOR
+from .const import DOMAIN, PLATFORM
+from .device_discovery import get_discovery_coordinator
 from .base_classes import ikea_blinds_sensor
 
 logger = logging.getLogger("custom_components.dirigera_platform")
@@ -23,11 +24,10 @@ async def async_setup_entry(
     async_add_entities(blinds_sensors)
 
     # Register callback and known devices with discovery coordinator
-    discovery = hass.data[DOMAIN].get(DISCOVERY_COORDINATOR)
+    discovery = get_discovery_coordinator(hass, config_entry.entry_id)
     if discovery:
         discovery.register_platform_callback("cover", async_add_entities)
-        for blind in devices:
-            discovery.register_known_device(blind._json_data.id)
+        discovery.bulk_register_known_devices(blind._json_data.id for blind in devices)
         logger.debug(f"Registered {len(devices)} blinds with discovery coordinator")
 
     logger.debug("BLINDS Complete async_setup_entry")
\ No newline at end of file
@@ -7,18 +7,26 @@ receives an event for an unknown device ID, it triggers this coordinator to
 fetch the device info and create the appropriate entity.
 """
 from __future__ import annotations
+import asyncio
 import logging
-from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 from homeassistant import core
 
+from .const import DOMAIN, DISCOVERY_COORDINATOR
+
 if TYPE_CHECKING:
     from .dirigera_lib_patch import HubX
 
 logger = logging.getLogger("custom_components.dirigera_platform")
 
-# Mapping from Dirigera deviceType to our internal platform type
-DEVICE_TYPE_TO_PLATFORM = {
+# Mapping from Dirigera deviceType to our internal platform type.
+# Read-only view so the mapping cannot be mutated at runtime; keys are
+# interned (see below) so lookups with interned event strings can take
+# the identity-comparison fast path instead of a full string compare.
+DEVICE_TYPE_TO_PLATFORM = MappingProxyType({
     "light": "light",
     "outlet": "switch",
     "airPurifier": "fan",
@@ -30,7 +38,15 @@ DEVICE_TYPE_TO_PLATFORM = {
     "lightSensor": "sensor",  # MYGGSPRAY illuminance
     "openCloseSensor": "binary_sensor",
     "waterSensor": "binary_sensor",
-}
+})
+DEVICE_TYPE_TO_PLATFORM = MappingProxyType(
+    {sys.intern(key): value for key, value in DEVICE_TYPE_TO_PLATFORM.items()}
+)
+
+# Device state bits. Known and pending live in one dict keyed by device id
+# so the hot path pays a single hash probe instead of one per set.
+_STATE_PENDING = 1  # Discovery currently in progress
+_STATE_KNOWN = 2  # Device already has an entity in HA
 
 
 class DeviceDiscoveryCoordinator:
@@ -42,12 +58,49 @@ class DeviceDiscoveryCoordinator:
     this coordinator fetches the device info and calls the appropriate callback.
     """
 
+    # Debounce window for coalescing discovery events into one batch
+    BATCH_WINDOW = 0.1
+
     def __init__(self, hass: core.HomeAssistant, hub: "HubX"):
         self._hass = hass
         self._hub = hub
         self._platform_callbacks: Dict[str, Callable] = {}
-        self._known_device_ids: set = set()
-        self._pending_discovery: set = set()  # Devices currently being discovered
+        self._devices: Dict[str, int] = {}  # device id -> _STATE_* bits
+        # Accumulates device id -> deviceType until the batch window elapses;
+        # only touched from the HA event loop
+        self._pending_batch: Dict[str, str] = {}
+        self._flush_handle = None
+
+    def enqueue_discovery(self, device_id: str, device_type: str) -> None:
+        """
+        Queue an unknown device for discovery, coalescing bursts of events
+        (e.g. after a hub reboot) into a single batched discovery call at
+        most BATCH_WINDOW seconds later.
+
+        Safe to call from any thread, including the WebSocket thread.
+
+        Args:
+            device_id: The ID of the new device
+            device_type: The deviceType from the WebSocket event
+        """
+        self._hass.loop.call_soon_threadsafe(self._enqueue, device_id, device_type)
+
+    def _enqueue(self, device_id: str, device_type: str) -> None:
+        # Event strings come fresh out of JSON parsing; interning the small
+        # bounded set of device types once here lets every later dict lookup
+        # hit the string identity fast path
+        self._pending_batch[device_id] = sys.intern(device_type)
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_later(self.BATCH_WINDOW, self._flush)
+
+    def _flush(self) -> None:
+        """Drain the accumulated events into one discover_devices call."""
+        self._flush_handle = None
+        events = list(self._pending_batch.items())
+        self._pending_batch.clear()
+        if events:
+            logger.debug("Flushing discovery batch of %d event(s)", len(events))
+            self._hass.async_create_task(self.discover_devices(events))
 
     def register_platform_callback(self, platform: str, callback: Callable) -> None:
         """
@@ -57,7 +110,7 @@ class DeviceDiscoveryCoordinator:
             platform: The platform name (light, sensor, switch, etc.)
             callback: The async_add_entities function from that platform
         """
-        logger.debug(f"Registering discovery callback for platform: {platform}")
+        logger.debug("Registering discovery callback for platform: %s", platform)
         self._platform_callbacks[platform] = callback
 
     def register_known_device(self, device_id: str) -> None:
@@ -67,7 +120,30 @@ class DeviceDiscoveryCoordinator:
         Args:
             device_id: The device ID from Dirigera
         """
-        self._known_device_ids.add(device_id)
+        self._devices[device_id] = self._devices.get(device_id, 0) | _STATE_KNOWN
+
+    def bulk_register_known_devices(self, device_ids: Iterable[str]) -> None:
+        """
+        Register a batch of device IDs as known in one call.
+
+        Platforms call this once at setup with all their entity IDs instead
+        of N register_known_device calls.
+
+        Args:
+            device_ids: The device IDs from Dirigera
+        """
+        devices = self._devices
+        for device_id in device_ids:
+            devices[device_id] = devices.get(device_id, 0) | _STATE_KNOWN
+
+    def invalidate_devices_cache(self) -> None:
+        """
+        Drop the hub's cached /devices response.
+
+        Called by the WebSocket listener on deviceAdded/deviceRemoved events
+        so the next bulk fetch reflects the new device population.
+        """
+        self._hub.invalidate_devices_cache()
 
     def is_known_device(self, device_id: str) -> bool:
         """
@@ -79,15 +155,15 @@ class DeviceDiscoveryCoordinator:
         Returns:
             True if the device is already registered, False otherwise
         """
-        return device_id in self._known_device_ids
+        return bool(self._devices.get(device_id, 0) & _STATE_KNOWN)
 
     async def discover_device(self, device_id: str, device_type: str) -> bool:
         """
-        Discover and register a new device.
+        Discover and register a single new device.
 
         This is called when the WebSocket listener receives an event for an
-        unknown device. It fetches the full device info from the API and
-        creates the appropriate entity.
+        unknown device. It is a convenience wrapper around discover_devices
+        with a one-element batch.
 
         Args:
             device_id: The ID of the new device
@@ -96,64 +172,125 @@ class DeviceDiscoveryCoordinator:
         Returns:
             True if the device was successfully discovered and added
         """
-        # Avoid duplicate discovery attempts
-        if device_id in self._pending_discovery:
-            logger.debug(f"Device {device_id} discovery already in progress, skipping")
-            return False
+        return await self.discover_devices([(device_id, device_type)]) > 0
 
-        if device_id in self._known_device_ids:
-            logger.debug(f"Device {device_id} already known, skipping discovery")
-            return False
+    async def discover_devices(self, events: List[Tuple[str, str]]) -> int:
+        """
+        Discover and register a batch of new devices.
 
-        self._pending_discovery.add(device_id)
+        When the hub emits a burst of events (e.g. after a reboot or mass
+        pairing), the listener coalesces them and calls this method once.
+        Device info fetches are issued concurrently and the resulting
+        entities are grouped by platform so each platform callback is
+        invoked exactly once with all its new entities - a single
+        async_add_entities call is far cheaper than N single-entity calls.
 
-        try:
-            logger.info(f"Discovering new device: {device_id} (type: {device_type})")
+        Args:
+            events: List of (device_id, device_type) tuples from the events
+
+        Returns:
+            The number of devices successfully discovered and added
+        """
+        # Filter out known/pending devices and types we cannot handle,
+        # de-duplicating within the batch via the pending bit. One dict
+        # probe yields both states; no await happens between reading the
+        # state and setting the pending bit, so the asyncio single-thread
+        # guarantee keeps this race-free across concurrent batches.
+        to_discover: List[Tuple[str, str]] = []
+        devices = self._devices
+        for device_id, device_type in events:
+            state = devices.get(device_id, 0)
+            if state & _STATE_KNOWN:
+                logger.debug("Device %s already known, skipping discovery", device_id)
+                continue
+
+            if state & _STATE_PENDING:
+                logger.debug("Device %s discovery already in progress, skipping", device_id)
+                continue
 
-            # Determine which platform handles this device type
             platform = DEVICE_TYPE_TO_PLATFORM.get(device_type)
             if platform is None:
-                logger.warning(f"Unknown device type '{device_type}' for device {device_id}, cannot discover")
-                return False
+                logger.warning("Unknown device type '%s' for device %s, cannot discover", device_type, device_id)
+                continue
 
-            # Check if we have a callback for this platform
             if platform not in self._platform_callbacks:
-                logger.warning(f"No callback registered for platform '{platform}', cannot add device {device_id}")
-                return False
-
-            # Fetch the full device info from the API
-            device_data = await self._hass.async_add_executor_job(
-                self._hub.get, f"/devices/{device_id}"
-            )
-
-            if device_data is None:
-                logger.error(f"Failed to fetch device data for {device_id}")
-                return False
-
-            logger.debug(f"Fetched device data for {device_id}: {device_data.get('attributes', {}).get('customName', 'unnamed')}")
+                logger.warning("No callback registered for platform '%s', cannot add device %s", platform, device_id)
+                continue
 
-            # Create the entity based on device type
-            entity = await self._create_entity(device_type, device_data)
-            if entity is None:
-                logger.error(f"Failed to create entity for device {device_id}")
-                return False
+            devices[device_id] = state | _STATE_PENDING
+            to_discover.append((device_id, device_type))
 
-            # Add the entity via the platform callback
-            callback = self._platform_callbacks[platform]
-            callback([entity])
+        if not to_discover:
+            return 0
 
-            # Mark as known
-            self._known_device_ids.add(device_id)
-            logger.info(f"Successfully discovered and added device: {device_id} ({device_data.get('attributes', {}).get('customName', 'unnamed')})")
-
-            return True
-
-        except Exception as ex:
-            logger.error(f"Error discovering device {device_id}: {ex}")
-            return False
+        try:
+            logger.info("Discovering %d new device(s): %s", len(to_discover), [d[0] for d in to_discover])
+
+            # One bulk /devices round trip serves the whole batch; only ids
+            # missing from the bulk response fall back to per-device GETs
+            indexed = await self._hass.async_add_executor_job(self._hub.get_devices_indexed)
+            device_datas: Dict[str, Any] = {
+                device_id: indexed.get(device_id) for device_id, _ in to_discover
+            }
+
+            misses = [device_id for device_id, data in device_datas.items() if data is None]
+            if misses:
+                fetched = await asyncio.gather(
+                    *[
+                        self._hass.async_add_executor_job(self._hub.get, f"/devices/{device_id}")
+                        for device_id in misses
+                    ],
+                    return_exceptions=True,
+                )
+                device_datas.update(zip(misses, fetched))
+
+            # Build entities and bucket them by platform
+            entities_by_platform: Dict[str, List[Any]] = {}
+            for device_id, device_type in to_discover:
+                device_data = device_datas[device_id]
+                if isinstance(device_data, Exception):
+                    logger.error("Error fetching device data for %s: %s", device_id, device_data)
+                    continue
+
+                if device_data is None:
+                    logger.error("Failed to fetch device data for %s", device_id)
+                    continue
+
+                logger.debug("Fetched device data for %s: %s", device_id, device_data.get('attributes', {}).get('customName', 'unnamed'))
+
+                entity = await self._create_entity(device_type, device_data)
+                if entity is None:
+                    logger.error("Failed to create entity for device %s", device_id)
+                    continue
+
+                platform = DEVICE_TYPE_TO_PLATFORM[device_type]
+                entities_by_platform.setdefault(platform, []).append(entity)
+
+                # Mark as known (pending bit is cleared in the finally below)
+                devices[device_id] = devices.get(device_id, 0) | _STATE_KNOWN
+                logger.info("Successfully discovered device: %s (%s)", device_id, device_data.get('attributes', {}).get('customName', 'unnamed'))
+
+            # Exactly one add_entities call per platform with all its entities
+            added = 0
+            for platform, entities in entities_by_platform.items():
+                callback = self._platform_callbacks[platform]
+                callback(entities)
+                added += len(entities)
+
+            return added
+
+        except Exception:
+            logger.exception("Error discovering devices %s", [d[0] for d in to_discover])
+            return 0
 
         finally:
-            self._pending_discovery.discard(device_id)
+            for device_id, _ in to_discover:
+                state = devices.get(device_id, 0) & ~_STATE_PENDING
+                if state:
+                    devices[device_id] = state
+                else:
+                    # Failed discovery - drop the entry so a retry can run
+                    devices.pop(device_id, None)
 
     async def _create_entity(self, device_type: str, device_data: Dict[str, Any]) -> Optional[Any]:
         """
@@ -170,122 +307,123 @@ class DeviceDiscoveryCoordinator:
         Returns:
             The HA entity object, or None if creation failed
         """
-        try:
-            # Import here to avoid circular imports
-            from .light import ikea_bulb
-            from .base_classes import (
-                # Device wrapper classes
-                ikea_blinds_device,
-                ikea_starkvind_air_purifier_device,
-                ikea_outlet_device,
-                ikea_vindstyrka_device,
-                ikea_controller_device,
-                ikea_open_close_device,
-                ikea_motion_sensor_device,
-                ikea_water_sensor_device,
-                ikea_light_sensor_device,
-                # HA entity classes (wrap the device wrappers)
-                ikea_outlet_switch_sensor,
-                ikea_blinds_sensor,
-                ikea_starkvind_air_purifier_fan,
-                ikea_motion_sensor,
-                ikea_open_close_sensor,
-                ikea_water_sensor,
-                ikea_light_sensor_lux,
-            )
-            from dirigera.devices.light import dict_to_light
-            from dirigera.devices.outlet import dict_to_outlet
-            from dirigera.devices.air_purifier import dict_to_air_purifier
-            from dirigera.devices.blinds import dict_to_blind
-            from dirigera.devices.open_close_sensor import dict_to_open_close_sensor
-            from dirigera.devices.water_sensor import dict_to_water_sensor
-            from dirigera.devices.environment_sensor import dict_to_environment_sensor
-            from dirigera.devices.light_sensor import dict_to_light_sensor
-            from .dirigera_lib_patch import (
-                dict_to_controller,
-                dict_to_motion_sensor_x,
-            )
-
-            if device_type == "light":
-                # Light: ikea_bulb IS the HA entity (no separate wrapper)
-                light = dict_to_light(device_data, self._hub)
-                return ikea_bulb(self._hub, light)
-
-            elif device_type == "outlet":
-                # Outlet: wrapper -> HA entity
-                outlet = dict_to_outlet(device_data, self._hub)
-                device_wrapper = ikea_outlet_device(self._hass, self._hub, outlet)
-                return ikea_outlet_switch_sensor(device_wrapper)
-
-            elif device_type == "airPurifier":
-                # Air Purifier: wrapper -> HA entity
-                purifier = dict_to_air_purifier(device_data, self._hub)
-                device_wrapper = ikea_starkvind_air_purifier_device(self._hass, self._hub, purifier)
-                return ikea_starkvind_air_purifier_fan(device_wrapper)
-
-            elif device_type == "blinds":
-                # Blinds: wrapper -> HA entity
-                blind = dict_to_blind(device_data, self._hub)
-                device_wrapper = ikea_blinds_device(self._hass, self._hub, blind)
-                return ikea_blinds_sensor(device_wrapper)
-
-            elif device_type == "environmentSensor":
-                # Environment sensor: creates multiple entities, handled differently
-                # For now, skip - these need special handling (temp, humidity, PM25, etc.)
-                logger.warning(f"Environment sensor discovery not yet implemented for {device_data.get('id')}")
-                return None
-
-            elif device_type == "controller":
-                # Controller: creates battery sensor, handled in sensor.py
-                # For now, skip - needs special handling
-                logger.warning(f"Controller discovery not yet implemented for {device_data.get('id')}")
-                return None
-
-            elif device_type in ("motionSensor", "occupancySensor"):
-                # Motion sensor: wrapper -> HA entity
-                sensor = dict_to_motion_sensor_x(device_data, self._hub)
-                device_wrapper = ikea_motion_sensor_device(self._hass, self._hub, sensor)
-                return ikea_motion_sensor(device_wrapper)
-
-            elif device_type == "lightSensor":
-                # Light sensor (MYGGSPRAY illuminance): wrapper -> HA entity
-                sensor = dict_to_light_sensor(device_data, self._hub)
-                device_wrapper = ikea_light_sensor_device(self._hass, self._hub, sensor)
-                return ikea_light_sensor_lux(device_wrapper)
-
-            elif device_type == "openCloseSensor":
-                # Open/close sensor: wrapper -> HA entity
-                sensor = dict_to_open_close_sensor(device_data, self._hub)
-                device_wrapper = ikea_open_close_device(self._hass, self._hub, sensor)
-                return ikea_open_close_sensor(device_wrapper)
-
-            elif device_type == "waterSensor":
-                # Water sensor: wrapper -> HA entity
-                sensor = dict_to_water_sensor(device_data, self._hub)
-                device_wrapper = ikea_water_sensor_device(self._hass, self._hub, sensor)
-                return ikea_water_sensor(device_wrapper)
-
-            else:
-                logger.warning(f"No entity creator for device type: {device_type}")
-                return None
-
-        except Exception as ex:
-            logger.error(f"Error creating entity for device type {device_type}: {ex}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return None
+        if not _CREATORS:
+            _load_creators()
 
+        if device_type == "environmentSensor":
+            # Environment sensor: creates multiple entities, handled differently
+            # For now, skip - these need special handling (temp, humidity, PM25, etc.)
+            logger.warning("Environment sensor discovery not yet implemented for %s", device_data.get('id'))
+            return None
 
-# Global instance - will be initialized in __init__.py
-discovery_coordinator: Optional[DeviceDiscoveryCoordinator] = None
+        if device_type == "controller":
+            # Controller: creates battery sensor, handled in sensor.py
+            # For now, skip - needs special handling
+            logger.warning("Controller discovery not yet implemented for %s", device_data.get('id'))
+            return None
 
+        creator = _CREATORS.get(device_type)
+        if creator is None:
+            logger.warning("No entity creator for device type: %s", device_type)
+            return None
 
-def get_discovery_coordinator() -> Optional[DeviceDiscoveryCoordinator]:
-    """Get the global discovery coordinator instance."""
-    return discovery_coordinator
+        # Only the dto/wrapper/entity construction can realistically fail
+        # here; keep the try narrow so the lookup path stays exception-free
+        try:
+            return creator(self._hass, self._hub, device_data)
+        except Exception:
+            logger.exception("Error creating entity for device type %s", device_type)
+            return None
 
 
-def set_discovery_coordinator(coordinator: DeviceDiscoveryCoordinator) -> None:
-    """Set the global discovery coordinator instance."""
-    global discovery_coordinator
-    discovery_coordinator = coordinator
+# device_type -> creator(hass, hub, device_data), built once on first use.
+# Populated lazily so the deferred imports (needed to break circular deps
+# with light/base_classes) run a single time instead of on every discovery.
+_CREATORS: Dict[str, Callable[..., Any]] = {}
+
+
+def _load_creators() -> None:
+    """Run the entity-creation imports once and populate _CREATORS."""
+    # Import here to avoid circular imports
+    from .light import ikea_bulb
+    from .base_classes import (
+        # Device wrapper classes
+        ikea_blinds_device,
+        ikea_starkvind_air_purifier_device,
+        ikea_outlet_device,
+        ikea_open_close_device,
+        ikea_motion_sensor_device,
+        ikea_water_sensor_device,
+        ikea_light_sensor_device,
+        # HA entity classes (wrap the device wrappers)
+        ikea_outlet_switch_sensor,
+        ikea_blinds_sensor,
+        ikea_starkvind_air_purifier_fan,
+        ikea_motion_sensor,
+        ikea_open_close_sensor,
+        ikea_water_sensor,
+        ikea_light_sensor_lux,
+    )
+    from dirigera.devices.light import dict_to_light
+    from dirigera.devices.outlet import dict_to_outlet
+    from dirigera.devices.air_purifier import dict_to_air_purifier
+    from dirigera.devices.blinds import dict_to_blind
+    from dirigera.devices.open_close_sensor import dict_to_open_close_sensor
+    from dirigera.devices.water_sensor import dict_to_water_sensor
+    from dirigera.devices.light_sensor import dict_to_light_sensor
+    from .dirigera_lib_patch import dict_to_motion_sensor_x_fast
+
+    # device_type -> (dict_to_xxx, device wrapper class, HA entity class).
+    # Every type follows the same shape: dto -> wrapper(hass, hub, dto) ->
+    # entity(wrapper). MYGGSPRAY occupancy sensors share the motion sensor
+    # factories.
+    device_type_factories = {
+        "outlet": (dict_to_outlet, ikea_outlet_device, ikea_outlet_switch_sensor),
+        "airPurifier": (dict_to_air_purifier, ikea_starkvind_air_purifier_device, ikea_starkvind_air_purifier_fan),
+        "blinds": (dict_to_blind, ikea_blinds_device, ikea_blinds_sensor),
+        "motionSensor": (dict_to_motion_sensor_x_fast, ikea_motion_sensor_device, ikea_motion_sensor),
+        "occupancySensor": (dict_to_motion_sensor_x_fast, ikea_motion_sensor_device, ikea_motion_sensor),
+        "lightSensor": (dict_to_light_sensor, ikea_light_sensor_device, ikea_light_sensor_lux),
+        "openCloseSensor": (dict_to_open_close_sensor, ikea_open_close_device, ikea_open_close_sensor),
+        "waterSensor": (dict_to_water_sensor, ikea_water_sensor_device, ikea_water_sensor),
+    }
+
+    def make_creator(dto, wrapper_cls, entity_cls):
+        def creator(hass, hub, device_data):
+            return entity_cls(wrapper_cls(hass, hub, dto(device_data, hub)))
+
+        return creator
+
+    def create_light(hass, hub, device_data):
+        # Light is the one exception: ikea_bulb IS the HA entity (no wrapper)
+        return ikea_bulb(hub, dict_to_light(device_data, hub))
+
+    _CREATORS["light"] = create_light
+    for device_type, factories in device_type_factories.items():
+        _CREATORS[device_type] = make_creator(*factories)
+
+
+# Coordinators are stored per config entry in hass.data[DOMAIN] so
+# multi-hub installs get one coordinator (and one batching window) per hub
+# instead of serializing through a module-level global.
+
+
+def get_discovery_coordinator(
+    hass: core.HomeAssistant, entry_id: str
+) -> Optional[DeviceDiscoveryCoordinator]:
+    """Get the discovery coordinator for a config entry, if one exists."""
+    return hass.data.get(DOMAIN, {}).get(DISCOVERY_COORDINATOR, {}).get(entry_id)
+
+
+def set_discovery_coordinator(
+    hass: core.HomeAssistant, entry_id: str, coordinator: DeviceDiscoveryCoordinator
+) -> None:
+    """Store the discovery coordinator for a config entry."""
+    hass.data.setdefault(DOMAIN, {}).setdefault(DISCOVERY_COORDINATOR, {})[entry_id] = coordinator
+
+
+def pop_discovery_coordinator(
+    hass: core.HomeAssistant, entry_id: str
+) -> Optional[DeviceDiscoveryCoordinator]:
+    """Remove and return the discovery coordinator for a config entry."""
+    return hass.data.get(DOMAIN, {}).get(DISCOVERY_COORDINATOR, {}).pop(entry_id, None)
@@ -1,29 +1,93 @@
 from __future__ import annotations
+import datetime
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from dirigera import Hub
 
-from dirigera.devices.device import Attributes, Device
+from dirigera.devices.device import Attributes, Capabilities, Device, Room
 from dirigera.hub.abstract_smart_home_hub import AbstractSmartHomeHub
-from dirigera.devices.scene import Info, Icon,  SceneType, Trigger, TriggerDetails, ControllerType
 import logging
 
 logger = logging.getLogger("custom_components.dirigera_platform")
 
+# Device types that are handled as motion sensors. IKEA MYGGSPRAY reports as
+# occupancySensor instead of motionSensor. frozenset gives O(1) membership
+# and avoids rebuilding a tuple literal at each call site.
+_MOTION_SENSOR_TYPES: frozenset = frozenset(("motionSensor", "occupancySensor"))
+
 
 class HubX(Hub):
     def __init__(
         self, token: str, ip_address: str, port: str = "8443", api_version: str = "v1"
     ) -> None:
         super().__init__(token, ip_address, port, api_version)
+        self._devices_cache: Dict[str, Dict] = {}
+        self._devices_type_index: Dict[str, List[Dict]] = {}
+        self._devices_cache_time: float = 0.0
+
+    @staticmethod
+    def _index_by_type(devices) -> Dict[str, List[Dict]]:
+        """
+        Buckets devices by type in a single pass.
+
+        Each device is indexed under its deviceType and, when different,
+        also under its top-level type (controllers report type "controller"
+        but deviceType "shortcutController"), so both getter styles resolve
+        with one O(1) dict access instead of an O(N) filter scan.
+        """
+        # Keys are interned so lookups with literal type strings compare by
+        # identity instead of character-by-character
+        index: Dict[str, List[Dict]] = {}
+        for device in devices:
+            device_type = device.get("deviceType")
+            if device_type is not None:
+                index.setdefault(sys.intern(device_type), []).append(device)
+            type_ = device.get("type")
+            if type_ is not None and type_ != device_type:
+                index.setdefault(sys.intern(type_), []).append(device)
+        return index
+
+    def get_devices_indexed(self, ttl: float = 1.0) -> Dict[str, Dict]:
+        """
+        Fetches all devices in one round trip and returns them indexed by id.
+
+        The result is cached for ttl seconds so that discovery bursts and the
+        per-type getters share a single /devices call instead of each issuing
+        their own. The cache is invalidated on deviceAdded/deviceRemoved
+        WebSocket events via invalidate_devices_cache.
+        """
+        now = time.monotonic()
+        if not self._devices_cache or now - self._devices_cache_time > ttl:
+            devices = self.get("/devices")
+            self._devices_cache = {device["id"]: device for device in devices}
+            self._devices_type_index = self._index_by_type(devices)
+            self._devices_cache_time = now
+        return self._devices_cache
+
+    def get_devices_by_type(self, device_type: str, ttl: float = 1.0) -> List[Dict]:
+        """
+        Returns the raw devices of a given type from the cached type index
+        """
+        self.get_devices_indexed(ttl)
+        return self._devices_type_index.get(device_type, [])
+
+    def invalidate_devices_cache(self) -> None:
+        """
+        Drops the cached /devices response, forcing a fresh fetch next time
+        """
+        self._devices_cache = {}
+        self._devices_type_index = {}
+        self._devices_cache_time = 0.0
 
     def get_controllers(self) -> List[ControllerX]:
         """
         Fetches all controllers registered in the Hub
         """
-        devices = self.get("/devices")
-        controllers = list(filter(lambda x: x["type"] == "controller", devices))
-        return [dict_to_controller(controller, self) for controller in controllers]
+        return [dict_to_controller_fast(controller, self) for controller in self.get_devices_by_type("controller")]
     
     # Scenes are a problem so making a hack
     def get_scenes(self):
@@ -32,8 +96,14 @@ class HubX(Hub):
         """
         scenes = self.get("/scenes")
         #scenes = list(filter(lambda x: x["type"] == "scene", devices))
-        
+
         return [HackScene.make_scene(self, scene) for scene in scenes]
+
+    def get_scenes_raw(self) -> List[Dict]:
+        """
+        Fetches all scenes as plain dicts, without HackScene construction
+        """
+        return self.get("/scenes")
     
     def get_scene_by_id(self, scene_id: str):
         """
@@ -42,43 +112,56 @@ class HubX(Hub):
         data = self.get(f"/scenes/{scene_id}")
         return HackScene.make_scene(self, data)
     
+    def _empty_scene_payload(self, controller_id: str, click: str) -> Dict:
+        scene_name = f'dirigera_integration_empty_scene_{controller_id}_{click}'
+        logger.debug("Creating empty scene : %s", scene_name)
+        return {
+                    "info": {"name" : scene_name, "icon" : "scenes_cake"},
+                    "type": "customScene",
+                    "triggers":[
+                                    {
+                                        "type": "controller",
+                                        "disabled": False,
+                                        "trigger":
+                                            {
+                                                "controllerType": "shortcutController",
+                                                "clickPattern": click,
+                                                "buttonIndex": 0,
+                                                "deviceId": controller_id
+                                            }
+                                    }
+                                ],
+            "actions": []
+        }
+
     def create_empty_scene(self, controller_id: str, clicks_supported:list):
-        logging.debug(f"Creating empty scene for controller : {controller_id} with clicks : {clicks_supported}")
-        for click in clicks_supported:
-            scene_name = f'dirigera_integration_empty_scene_{controller_id}_{click}'
-            info = Info(name=f'dirigera_integration_empty_scene_{controller_id}_{click}', icon=Icon.SCENES_CAKE)
-            device_trigger = Trigger(type="controller", disabled=False,
-                                     trigger=TriggerDetails(clickPattern=click, buttonIndex=0, deviceId=controller_id, controllerType=ControllerType.SHORTCUT_CONTROLLER))
-
-            logger.debug(f"Creating empty scene : {info.name}")
-            #self.create_scene(info=info, scene_type=SceneType.USER_SCENE,triggers=[device_trigger])
-            data = {
-                        "info": {"name" : scene_name, "icon" : "scenes_cake"},
-                        "type": "customScene",
-                        "triggers":[
-                                        {
-                                            "type": "controller", 
-                                            "disabled": False, 
-                                            "trigger": 
-                                                {
-                                                    "controllerType": "shortcutController",
-                                                    "clickPattern": click,
-                                                    "buttonIndex": 0,
-                                                    "deviceId": controller_id
-                                                }
-                                        }
-                                    ],
-                "actions": []
-            }
-            
-            self.post("/scenes/", data=data)
-        
+        logger.debug("Creating empty scene for controller : %s with clicks : %s", controller_id, clicks_supported)
+        if not clicks_supported:
+            return
+
+        # Build all payloads up front, then issue the independent POSTs
+        # concurrently instead of blocking serially on each round trip
+        payloads = [self._empty_scene_payload(controller_id, click) for click in clicks_supported]
+        with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+            list(executor.map(lambda data: self.post("/scenes/", data=data), payloads))
+
     def delete_empty_scenes(self):
-        scenes = self.get_scenes()
-        for scene in scenes:
-            if scene.name.startswith("dirigera_integration_empty_scene_"):
-                logging.debug(f"Deleting Scene id: {scene.id} name: {scene.name}...")
-                self.delete_scene(scene.id)
+        # Filter at the raw-JSON layer - no point building HackScene objects
+        # for scenes that are immediately discarded
+        prefix = "dirigera_integration_empty_scene_"
+        to_delete = []
+        for scene in self.get_scenes_raw():
+            name = scene["info"]["name"]
+            if name.startswith(prefix):
+                logger.debug("Deleting Scene id: %s name: %s...", scene["id"], name)
+                to_delete.append(scene["id"])
+
+        if not to_delete:
+            return
+
+        # The deletes are independent, issue them concurrently
+        with ThreadPoolExecutor(max_workers=len(to_delete)) as executor:
+            list(executor.map(self.delete_scene, to_delete))
 
     def get_motion_sensors(self) -> List[MotionSensorX]:
         """
@@ -86,9 +169,11 @@ class HubX(Hub):
         Includes both motionSensor and occupancySensor device types.
         IKEA MYGGSPRAY sensors report as occupancySensor instead of motionSensor.
         """
-        devices = self.get("/devices")
-        sensors = list(filter(lambda x: x["deviceType"] in ("motionSensor", "occupancySensor"), devices))
-        return [dict_to_motion_sensor_x(sensor, self) for sensor in sensors]
+        return [
+            dict_to_motion_sensor_x_fast(sensor, self)
+            for device_type in ("motionSensor", "occupancySensor")
+            for sensor in self.get_devices_by_type(device_type)
+        ]
 
     def get_motion_sensor_by_id(self, id_: str) -> MotionSensorX:
         """
@@ -96,11 +181,82 @@ class HubX(Hub):
         Accepts both motionSensor and occupancySensor device types.
         """
         motion_sensor = self._get_device_data_by_id(id_)
-        if motion_sensor["deviceType"] not in ("motionSensor", "occupancySensor"):
+        if motion_sensor["deviceType"] not in _MOTION_SENSOR_TYPES:
             raise ValueError("Device is not a MotionSensor or OccupancySensor")
         return dict_to_motion_sensor_x(motion_sensor, self)
 
 
+_SNAKE_CASE_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _to_snake_case(name: str) -> str:
+    return _SNAKE_CASE_RE.sub("_", name).lower()
+
+
+def _construct(model_cls, **fields):
+    """
+    Builds a pydantic model without running field validation
+    (model_construct on v2, construct on v1)
+    """
+    construct = getattr(model_cls, "model_construct", None) or model_cls.construct
+    return construct(**fields)
+
+
+def _parse_datetime(value):
+    if isinstance(value, str):
+        try:
+            return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    return value
+
+
+def _construct_device(device_cls, attributes_cls, data: Dict[str, Any], dirigera_client: AbstractSmartHomeHub):
+    """
+    Builds a device model from a hub payload, bypassing pydantic validation.
+
+    Validation is by far the most expensive step of device construction and
+    buys nothing for JSON we just fetched from our own hub. Keys are
+    snake-cased manually, the nested attributes/capabilities/room models are
+    constructed the same way, and the two datetime fields are coerced once.
+    Raises if the payload is missing expected keys - callers fall back to
+    the validated constructor in that case.
+    """
+    fields = {_to_snake_case(key): value for key, value in data.items()}
+    fields["attributes"] = _construct(
+        attributes_cls,
+        **{_to_snake_case(key): value for key, value in data["attributes"].items()},
+    )
+    fields["capabilities"] = _construct(
+        Capabilities,
+        can_send=data["capabilities"]["canSend"],
+        can_receive=data["capabilities"]["canReceive"],
+    )
+    room = data.get("room")
+    fields["room"] = _construct(Room, **room) if room is not None else None
+    for key in ("created_at", "last_seen"):
+        if key in fields:
+            fields[key] = _parse_datetime(fields[key])
+    fields.setdefault("device_set", [])
+    fields.setdefault("remote_links", [])
+    return _construct(device_cls, dirigera_client=dirigera_client, **fields)
+
+
+def _refresh_attributes(device: Device, data: Dict[str, Any]) -> None:
+    """
+    Refreshes a device's attributes in place from a /devices/{id} response.
+
+    Only the attributes sub-model is re-validated; the outer Device
+    (id, capabilities, room, ...) is left untouched, which roughly halves
+    the pydantic work compared to rebuilding the whole model per reload.
+    """
+    attributes_cls = type(device.attributes)
+    if hasattr(attributes_cls, "model_validate"):  # pydantic v2
+        device.attributes = attributes_cls.model_validate(data["attributes"])
+    else:  # pydantic v1
+        device.attributes = attributes_cls.parse_obj(data["attributes"])
+
+
 class ControllerAttributesX(Attributes):
     is_on: Optional[bool] = None
     battery_percentage: Optional[int] = None
@@ -111,6 +267,14 @@ class ControllerX(Device):
     attributes: ControllerAttributesX
 
     def reload(self) -> ControllerX:
+        data = self.dirigera_client.get(route=f"/devices/{self.id}")
+        _refresh_attributes(self, data)
+        return self
+
+    def reload_full(self) -> ControllerX:
+        """
+        Reloads into a brand new, fully re-validated ControllerX
+        """
         data = self.dirigera_client.get(route=f"/devices/{self.id}")
         return ControllerX(dirigeraClient=self.dirigera_client, **data)
 
@@ -129,20 +293,38 @@ def dict_to_controller(
 ) -> ControllerX:
     return ControllerX(dirigeraClient=dirigera_client, **data)
 
+
+def dict_to_controller_fast(
+    data: Dict[str, Any], dirigera_client: AbstractSmartHomeHub
+) -> ControllerX:
+    """
+    Fast-path variant of dict_to_controller that skips pydantic validation.
+    Only for payloads fetched from our own hub; falls back to the validated
+    constructor if the payload does not have the expected shape.
+    """
+    try:
+        return _construct_device(ControllerX, ControllerAttributesX, data, dirigera_client)
+    except Exception:
+        logger.debug("Fast controller construct failed, using validated path", exc_info=True)
+        return dict_to_controller(data, dirigera_client)
+
 class HackScene():
+    __slots__ = ("hub", "id", "name", "icon")
 
     def __init__(self, hub, id, name, icon):
         self.hub = hub
-        self.id = id 
-        self.name = name 
+        self.id = id
+        self.name = name
         self.icon = icon
 
+    @staticmethod
     def parse_scene_json(json_data):
         id = json_data["id"]
         name = json_data["info"]["name"]
         icon = json_data["info"]["icon"]
-        return id, name, icon 
-    
+        return id, name, icon
+
+    @staticmethod
     def make_scene(dirigera_client, json_data):
         id, name, icon = HackScene.parse_scene_json(json_data)
         return HackScene(dirigera_client, id, name, icon)
@@ -173,6 +355,14 @@ class MotionSensorX(Device):
     attributes: MotionSensorAttributesX
 
     def reload(self) -> "MotionSensorX":
+        data = self.dirigera_client.get(route=f"/devices/{self.id}")
+        _refresh_attributes(self, data)
+        return self
+
+    def reload_full(self) -> "MotionSensorX":
+        """
+        Reloads into a brand new, fully re-validated MotionSensorX
+        """
         data = self.dirigera_client.get(route=f"/devices/{self.id}")
         return MotionSensorX(dirigeraClient=self.dirigera_client, **data)
 
@@ -187,4 +377,19 @@ class MotionSensorX(Device):
 def dict_to_motion_sensor_x(
     data: Dict[str, Any], dirigera_client: AbstractSmartHomeHub
 ) -> MotionSensorX:
-    return MotionSensorX(dirigeraClient=dirigera_client, **data)
\ No newline at end of file
+    return MotionSensorX(dirigeraClient=dirigera_client, **data)
+
+
+def dict_to_motion_sensor_x_fast(
+    data: Dict[str, Any], dirigera_client: AbstractSmartHomeHub
+) -> MotionSensorX:
+    """
+    Fast-path variant of dict_to_motion_sensor_x that skips pydantic
+    validation. Only for payloads fetched from our own hub; falls back to
+    the validated constructor if the payload does not have the expected shape.
+    """
+    try:
+        return _construct_device(MotionSensorX, MotionSensorAttributesX, data, dirigera_client)
+    except Exception:
+        logger.debug("Fast motion sensor construct failed, using validated path", exc_info=True)
+        return dict_to_motion_sensor_x(data, dirigera_client)
\ No newline at end of file
@@ -4,7 +4,8 @@ from dirigera import Hub
 
 from homeassistant import config_entries, core
 
-from .const import DOMAIN, PLATFORM, DISCOVERY_COORDINATOR
+from .const import DOMAIN, PLATFORM
+from .device_discovery import get_discovery_coordinator
 from .base_classes import ikea_starkvind_air_purifier_fan
 
 logger = logging.getLogger("custom_components.dirigera_platform")
@@ -23,11 +24,10 @@ async def async_setup_entry(
     async_add_entities(fan_sensors)
 
     # Register callback and known devices with discovery coordinator
-    discovery = hass.data[DOMAIN].get(DISCOVERY_COORDINATOR)
+    discovery = get_discovery_coordinator(hass, config_entry.entry_id)
     if discovery:
         discovery.register_platform_callback("fan", async_add_entities)
-        for purifier in air_purifier_devices:
-            discovery.register_known_device(purifier._json_data.id)
+        discovery.bulk_register_known_devices(purifier._json_data.id for purifier in air_purifier_devices)
         logger.debug(f"Registered {len(air_purifier_devices)} air purifiers with discovery coordinator")
 
     logger.debug("FAN/AirPurifier Complete async_setup_entry")
@@ -439,23 +439,23 @@ class hub_event_listener(threading.Thread):
 
             # Handle deviceAdded events - trigger dynamic discovery
             if msg['type'] == "deviceAdded":
+                if self._discovery_coordinator is not None:
+                    self._discovery_coordinator.invalidate_devices_cache()
                 if "data" in msg and "id" in msg['data']:
                     device_id = msg['data']['id']
                     device_type = msg['data'].get('deviceType', msg['data'].get('type'))
                     if device_type and self._discovery_coordinator is not None:
                         logger.info(f"Device added event received: {device_id} (type: {device_type})")
-                        # Schedule discovery on the main event loop
-                        self._hass.loop.call_soon_threadsafe(
-                            lambda did=device_id, dt=device_type: self._hass.async_create_task(
-                                self._discovery_coordinator.discover_device(did, dt)
-                            )
-                        )
+                        # The coordinator debounces and batches these events
+                        self._discovery_coordinator.enqueue_discovery(device_id, device_type)
                     else:
                         logger.debug(f"deviceAdded event without discovery coordinator or type: {msg}")
                 return
 
             # Log deviceRemoved events for now (entities will become unavailable)
             if msg['type'] == "deviceRemoved":
+                if self._discovery_coordinator is not None:
+                    self._discovery_coordinator.invalidate_devices_cache()
                 if "data" in msg and "id" in msg['data']:
                     device_id = msg['data']['id']
                     logger.info(f"Device removed event received: {device_id}")
@@ -493,12 +493,8 @@ class hub_event_listener(threading.Thread):
                 # Unknown device - try to discover it
                 if self._discovery_coordinator is not None:
                     logger.info(f"Unknown device detected: {id} (type: {device_type}), triggering discovery")
-                    # Schedule discovery on the main event loop
-                    self._hass.loop.call_soon_threadsafe(
-                        lambda: self._hass.async_create_task(
-                            self._discovery_coordinator.discover_device(id, device_type)
-                        )
-                    )
+                    # The coordinator debounces and batches these events
+                    self._discovery_coordinator.enqueue_discovery(id, device_type)
                 else:
                     logger.info(f"discarding message as device for id: {id} not found for msg: {msg}")
                 return
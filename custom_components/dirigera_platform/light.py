@@ -18,7 +18,7 @@ from homeassistant.const import CONF_IP_ADDRESS, CONF_TOKEN
 from homeassistant.core import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 
-from .const import DOMAIN, CONF_HIDE_DEVICE_SET_BULBS, PLATFORM, DISCOVERY_COORDINATOR
+from .const import DOMAIN, CONF_HIDE_DEVICE_SET_BULBS, PLATFORM
 from .hub_event_listener import hub_event_listener, registry_entry
 from .device_discovery import get_discovery_coordinator
 
@@ -78,11 +78,10 @@ async def async_setup_entry(
     async_add_entities(lights)
 
     # Register callback and known devices with discovery coordinator
-    discovery = hass.data[DOMAIN].get(DISCOVERY_COORDINATOR)
+    discovery = get_discovery_coordinator(hass, config_entry.entry_id)
     if discovery:
         discovery.register_platform_callback("light", async_add_entities)
-        for light in all_lights:
-            discovery.register_known_device(light._json_data.id)
+        discovery.bulk_register_known_devices(light._json_data.id for light in all_lights)
         logger.debug(f"Registered {len(all_lights)} lights with discovery coordinator")
 
     logger.debug("LIGHT Complete async_setup_entry")
@@ -29,7 +29,8 @@ from homeassistant.const import CONF_IP_ADDRESS, CONF_TOKEN, UnitOfTime, CONCENT
 from homeassistant.core import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN, PLATFORM, DISCOVERY_COORDINATOR
+from .const import DOMAIN, PLATFORM
+from .device_discovery import get_discovery_coordinator
 
 logger = logging.getLogger("custom_components.dirigera_platform")
 
@@ -75,15 +76,13 @@ async def async_setup_entry(
     await add_air_purifier_sensors(async_add_entities, platform.air_purifiers)
 
     # Register callback and known devices with discovery coordinator
-    discovery = hass.data[DOMAIN].get(DISCOVERY_COORDINATOR)
+    discovery = get_discovery_coordinator(hass, config_entry.entry_id)
     if discovery:
         discovery.register_platform_callback("sensor", async_add_entities)
-        for sensor in platform.environment_sensors:
-            discovery.register_known_device(sensor._json_data.id)
-        for sensor in platform.light_sensors:
-            discovery.register_known_device(sensor._json_data.id)
-        for controller in platform.controllers:
-            discovery.register_known_device(controller._json_data.id)
+        discovery.bulk_register_known_devices(
+            device._json_data.id
+            for device in platform.environment_sensors + platform.light_sensors + platform.controllers
+        )
         total = len(platform.environment_sensors) + len(platform.light_sensors) + len(platform.controllers)
         logger.debug(f"Registered {total} sensors with discovery coordinator")
 
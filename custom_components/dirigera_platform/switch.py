@@ -2,8 +2,9 @@ import logging
 
 from homeassistant import config_entries, core
 
-from .const import DOMAIN, PLATFORM, DISCOVERY_COORDINATOR
+from .const import DOMAIN, PLATFORM
 from .base_classes import ikea_outlet_switch_sensor
+from .device_discovery import get_discovery_coordinator
 from .ikea_gateway import ikea_gateway
 from .base_classes import ikea_starkvind_air_purifier_switch_sensor
 
@@ -46,11 +47,10 @@ async def async_setup_entry(
     async_add_entities(air_purifier_entities)
 
     # Register callback and known devices with discovery coordinator
-    discovery = hass.data[DOMAIN].get(DISCOVERY_COORDINATOR)
+    discovery = get_discovery_coordinator(hass, config_entry.entry_id)
     if discovery:
         discovery.register_platform_callback("switch", async_add_entities)
-        for outlet in platform.outlets:
-            discovery.register_known_device(outlet._json_data.id)
+        discovery.bulk_register_known_devices(outlet._json_data.id for outlet in platform.outlets)
         logger.debug(f"Registered {len(platform.outlets)} outlets with discovery coordinator")
 
     logger.debug("SWITCH Complete async_setup_entry")
\ No newline at end of file